@@ -1,19 +1,48 @@
+import asyncio
+import hashlib
+import mmap
+from collections import OrderedDict
+from tempfile import SpooledTemporaryFile
+
 from fastapi import APIRouter, UploadFile, File, HTTPException, Body
+from fastapi.responses import ORJSONResponse
 from typing import Union, Dict, Any
 from pydantic import BaseModel
 
-from .ocr_engine import OCREngine
+from .ocr_engine import get_ocr_engine
 from .eligibility import EligibilityEngine
 
 
-# Initialize Router
+# Upload streaming knobs: read the body in 1 MiB chunks and keep uploads
+# up to 8 MiB in memory; anything larger spills to disk and is mmap'ed
+# so the OCR pipeline reads page-cache pages instead of a userspace copy
+UPLOAD_CHUNK_SIZE = 1 << 20
+UPLOAD_SPOOL_SIZE = 8 << 20
+
+# OCR results keyed by file-content hash so re-uploads of the same
+# document (retries, eligibility re-checks) skip the whole OCR pipeline.
+# Bounded in-process LRU; hashing costs ~ms, OCR costs seconds.
+OCR_CACHE_MAX_ENTRIES = 256
+_ocr_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _file_digest(file_bytes) -> str:
+    """
+    Content hash used as the OCR cache key
+    """
+    return hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+
+
+# Initialize Router - orjson responses serialize the large raw_text
+# payload in C instead of stdlib json's Python encoder
 router = APIRouter(
     prefix="/api/v1",
-    tags=["verification"]
+    tags=["verification"],
+    default_response_class=ORJSONResponse
 )
 
-# Initialize OCR and Eligibility Engines
-ocr_engine = OCREngine()
+# Initialize Eligibility Engine (cheap); the OCR engine is created
+# lazily via get_ocr_engine() so import never blocks on model loading
 eligibility_engine = EligibilityEngine()
 
 
@@ -45,22 +74,57 @@ async def upload_document(file: UploadFile = File(...)) -> Dict[str, Any]:
                 detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
             )
         
-        # Read file bytes
-        file_bytes = await file.read()
+        # Stream the upload in chunks instead of buffering it whole
+        spool = SpooledTemporaryFile(max_size=UPLOAD_SPOOL_SIZE)
+        try:
+            total_size = 0
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                spool.write(chunk)
+                total_size += len(chunk)
+
+            # Check if file is empty
+            if total_size == 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Uploaded file is empty"
+                )
+
+            if total_size > UPLOAD_SPOOL_SIZE:
+                # Spilled to disk - map it read-only; the mapping stays
+                # valid after the temp file is closed
+                spool.flush()
+                file_bytes = mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Still in memory - small enough to hand over directly
+                spool.seek(0)
+                file_bytes = spool.read()
+        finally:
+            spool.close()
         
-        # Check if file is empty
-        if len(file_bytes) == 0:
-            raise HTTPException(
-                status_code=400,
-                detail="Uploaded file is empty"
+        # Serve repeat uploads of the same content from the cache
+        cache_key = _file_digest(file_bytes)
+        extracted_data = _ocr_cache.get(cache_key)
+
+        if extracted_data is None:
+            # Fetch the engine off-loop: the first call pays the full
+            # model load + warm-up, which must not freeze the event loop
+            ocr_engine = await asyncio.get_running_loop().run_in_executor(
+                None, get_ocr_engine
             )
-        
-        # Process file with OCR
-        text_list = ocr_engine.process_file(file_bytes, file.filename)
-        
-        # Extract structured data
-        extracted_data = ocr_engine.extract_data(text_list)
-        
+
+            # Process file with OCR via the micro-batching queue so
+            # concurrent uploads share batched inference calls
+            text_list = await ocr_engine.process_file_async(file_bytes, file.filename)
+
+            # Extract structured data
+            extracted_data = ocr_engine.extract_data(text_list)
+
+            _ocr_cache[cache_key] = extracted_data
+            if len(_ocr_cache) > OCR_CACHE_MAX_ENTRIES:
+                _ocr_cache.popitem(last=False)
+        else:
+            _ocr_cache.move_to_end(cache_key)
+
         return {
             "status": "success",
             "filename": file.filename,
@@ -1,13 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .api import router
 
 # Initialize FastAPI application
+# orjson serializes responses in C with SIMD-accelerated UTF-8 handling,
+# which matters for the large raw_text field in OCR responses
 app = FastAPI(
     title="UnivAegis Verification Engine",
     description="Admissions Document Verification API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Middleware Configuration
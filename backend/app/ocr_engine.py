@@ -1,17 +1,215 @@
+import asyncio
 import io
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import easyocr
 import fitz  # PyMuPDF
 import numpy as np
 from PIL import Image
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
+
+try:
+    # Optional: Intel Hyperscan scans all patterns in one SIMD-accelerated
+    # linear pass. Used as a prefilter; extraction still goes through `re`
+    # because Hyperscan does not report capture groups.
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Optional: libjpeg-turbo decodes JPEGs with SIMD Huffman/IDCT routines
+    # directly into a numpy buffer, typically 2-5x faster than PIL
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+    TJPF_RGB = None
+
+try:
+    # Optional: Google RE2 compiles to a DFA with guaranteed linear-time
+    # matching - no catastrophic backtracking on hostile OCR output
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Regex patterns are compiled once at import time so each request only pays
+# for the actual search, not pattern parsing and flag handling.
+#
+# Each category is fused into a single alternation so the text is scanned
+# once instead of once per pattern. Every alternative carries exactly one
+# named group holding the captured value.
+
+# GPA/Percentage pattern - covers CGPA/GPA/Grade/Percentage/Score variations
+_GPA_PATTERN = (
+    # CGPA variations (plain, parenthesized and dotted forms)
+    r'\(?C\.?G\.?P\.?A\.?\)?[:\s\-]*(?P<cgpa>\d+\.?\d*)'
+    # GPA variations
+    r'|G\.?P\.?A\.?[:\s\-]*(?P<gpa>\d+\.?\d*)'
+    # Grade variations
+    r'|Final\s+Grade[:\s\-]*(?P<final_grade>\d+\.?\d*)'
+    r'|Grade[:\s\-]*(?P<grade>\d+\.?\d*)'
+    # Percentage variations
+    r'|Percentage[:\s\-]*(?P<percentage>\d+\.?\d*)'
+    r'|(?P<pct_sign>\d{1,3}\.?\d*)\s*%'
+    r'|Percent[:\s\-]*(?P<percent>\d+\.?\d*)'
+    # Score variations
+    r'|Score[:\s\-]*(?P<score>\d+\.?\d*)'
+    r'|Total[:\s\-]*(?P<total>\d+\.?\d*)'
+)
+
+# Student name pattern - "Name:", "Name of Student:" and "Candidate:" strategies
+_NAME_PATTERN = (
+    r'Name\s+of\s+(?:the\s+)?Student[:\s]+(?P<name_of_student>[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})'
+    r'|(?:Student\s+)?Name[:\s]+(?P<name>[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})'
+    r'|Candidate[:\s]+(?P<candidate>[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})'
+)
+
+# Financial information pattern - balance, amount and fee variations
+_FINANCIAL_PATTERN = (
+    r'(?:Available\s+|Current\s+)?Balance[:\s]*(?:Rs\.?|INR|₹|\$)\s*(?P<balance>[0-9,]+\.?[0-9]*)'
+    r'|Amount[:\s]*(?:Rs\.?|INR|₹|\$)\s*(?P<amount>[0-9,]+\.?[0-9]*)'
+    r'|Total[:\s]*(?:Rs\.?|INR|₹|\$)\s*(?P<total>[0-9,]+\.?[0-9]*)'
+    r'|Fee[s]?[:\s]*(?:Rs\.?|INR|₹|\$)\s*(?P<fee>[0-9,]+\.?[0-9]*)'
+    r'|Tuition[:\s]*(?:Rs\.?|INR|₹|\$)\s*(?P<tuition>[0-9,]+\.?[0-9]*)'
+)
+
+
+def _compile_pattern(pattern: str):
+    """
+    Compile a pattern with RE2 when available, falling back to re
+
+    None of the patterns use backreferences, so RE2's linear-time DFA
+    is a drop-in replacement for the backtracking stdlib engine
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, re2.IGNORECASE)
+        except Exception as e:
+            print(f"RE2 rejected pattern, using re: {e}")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+_GPA_RE = _compile_pattern(_GPA_PATTERN)
+_NAME_RE = _compile_pattern(_NAME_PATTERN)
+_FINANCIAL_RE = _compile_pattern(_FINANCIAL_PATTERN)
+
+
+def _match_value(match) -> str:
+    """
+    Return the value of the one named group that matched in a fused
+    alternation (engine-neutral; RE2 matches lack lastgroup)
+    """
+    return next(v for v in match.groupdict().values() if v is not None)
+
+# Common OCR artifacts and institutional words that terminate a name;
+# lowercased so membership checks are one O(1) hash lookup
+_NAME_STOPWORDS = frozenset({
+    'university', 'college', 'institute', 'school', 'department',
+    'faculty', 'of', 'the', 'and', 'cgpa', 'gpa', 'grade'
+})
+
+# Confidence keywords, found in one scan instead of one substring probe
+# (and one lowercase copy of the text) per keyword
+_KEYWORD_RE = re.compile(r'name|cgpa|gpa|grade|student|university')
+_KEYWORD_TOTAL = 6
+
+# Extraction categories feeding the confidence score: GPA, Name, Balance
+_EXTRACTION_ATTEMPTS = 3
+
+# Cheap substring prefilters: CPython's str `in` uses a SIMD-accelerated
+# memmem, so probing a few anchors is far cheaper than running an
+# alternation that cannot match. Each tuple must be a superset of what
+# its category pattern can match (false positives are fine).
+# The dotted anchors cover OCR forms like 'C.G.P.A.'/'G.P.A.' where the
+# dots break the plain 'gpa' substring
+_GPA_ANCHORS = ('gpa', 'g.p.a', 'g.pa', 'gp.a', 'percent', 'grade', '%', 'score', 'total')
+_NAME_ANCHORS = ('name', 'candidate')
+_FINANCIAL_ANCHORS = ('rs', 'inr', '₹', '$')
+
+# Hyperscan prefilter: capture-free versions of the three category
+# alternations, compiled into one database so the OCR text is scanned
+# once to learn which categories can match at all.
+_HS_GPA, _HS_NAME, _HS_FINANCIAL = 0, 1, 2
+
+_HS_EXPRESSIONS = [
+    (_HS_GPA, _GPA_PATTERN),
+    (_HS_NAME, _NAME_PATTERN),
+    (_HS_FINANCIAL, _FINANCIAL_PATTERN),
+]
+
+
+def _build_hs_database():
+    """
+    Compile the category patterns into a Hyperscan database.
+    Returns None if Hyperscan is unavailable or compilation fails.
+    """
+    if hyperscan is None:
+        return None
+    try:
+        # Strip named groups - Hyperscan rejects capture-group syntax
+        expressions = [
+            re.sub(r'\(\?P<[^>]+>', '(?:', pattern).encode()
+            for _, pattern in _HS_EXPRESSIONS
+        ]
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=[hs_id for hs_id, _ in _HS_EXPRESSIONS],
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions)
+        )
+        return db
+    except Exception as e:
+        print(f"Hyperscan unavailable, falling back to re: {e}")
+        return None
+
+
+_HS_DATABASE = _build_hs_database()
+
+
+def _hs_matching_categories(raw_text: str) -> Optional[Set[int]]:
+    """
+    Scan text once with Hyperscan and return the set of category ids
+    that have at least one match. Returns None when Hyperscan is not
+    available, meaning all categories must be tried with re.
+    """
+    if _HS_DATABASE is None:
+        return None
+    matched: Set[int] = set()
+
+    def on_match(hs_id, start, end, flags, context):
+        matched.add(hs_id)
+
+    try:
+        _HS_DATABASE.scan(raw_text.encode(), match_event_handler=on_match)
+    except Exception:
+        return None
+    return matched
+
+
+# Micro-batching knobs: how many requests one inference call may cover
+# and how long the worker waits for more requests to arrive
+_BATCH_MAX_SIZE = 8
+_BATCH_MAX_WAIT = 0.01  # seconds
+
+_IMAGE_EXTENSIONS = ['jpg', 'jpeg', 'png', 'bmp', 'tiff', 'webp']
+
+# Minimum embedded-text length for a PDF's text layer to be trusted;
+# scanned documents produce little or no embedded text and need OCR
+_PDF_TEXT_MIN_CHARS = 200
+
+# Dedicated executor for blocking OCR work so inference never competes
+# with the event loop's default thread pool (used for request I/O).
+# A single worker is enough: there is one model, and EasyOCR releases
+# the GIL inside its native decode/inference code.
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
 
 
 class OCREngine:
     """
     OCR Engine for extracting text and structured data from documents
     """
-    
+
     def __init__(self):
         """
         Initialize EasyOCR Reader with English language support
@@ -20,12 +218,206 @@ class OCREngine:
         try:
             # Try to initialize with GPU support
             self.reader = easyocr.Reader(['en'], gpu=True)
+            self._gpu = True
             print("OCR Engine initialized with GPU support")
         except Exception as e:
             # Fall back to CPU if GPU is not available
             print(f"GPU not available, using CPU: {e}")
             self.reader = easyocr.Reader(['en'], gpu=False)
+            self._gpu = False
             print("OCR Engine initialized with CPU")
+
+        # On CPU the recognizer's matrix multiplies are bandwidth-bound on
+        # FP32 weights, so quantize them to int8 before warm-up
+        if not self._gpu:
+            self._quantize_recognizer()
+
+        # Warm up the model once with a dummy image so the first real
+        # request does not pay CUDA kernel / model initialization costs
+        try:
+            self.reader.readtext(np.zeros((32, 32, 3), dtype=np.uint8), detail=0)
+        except Exception as e:
+            print(f"OCR warm-up skipped: {e}")
+
+        # Micro-batch queue: requests enqueue (file_bytes, filename, future)
+        # and a background worker groups them into one inference call
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._batch_worker_task = None
+
+        # Optional SIMD JPEG decoder (needs the libturbojpeg shared library)
+        self._turbojpeg = None
+        if TurboJPEG is not None:
+            try:
+                self._turbojpeg = TurboJPEG()
+            except Exception as e:
+                print(f"TurboJPEG unavailable, using PIL for JPEG decode: {e}")
+
+    def _quantize_recognizer(self):
+        """
+        Dynamically quantize the recognizer's Linear/LSTM layers to int8
+
+        Halves the bytes moved per matrix multiply and lets PyTorch use
+        int8 kernels (VNNI on supporting CPUs), typically a 2-4x speedup
+        for CPU recognition with negligible accuracy loss. Left as-is on
+        any failure so quantization is strictly best-effort
+        """
+        try:
+            import torch
+
+            self.reader.recognizer = torch.quantization.quantize_dynamic(
+                self.reader.recognizer,
+                {torch.nn.Linear, torch.nn.LSTM},
+                dtype=torch.qint8
+            )
+            print("OCR recognizer quantized to int8 for CPU inference")
+        except Exception as e:
+            print(f"Recognizer quantization skipped: {e}")
+
+    def start_batch_worker(self):
+        """
+        Start the background micro-batching worker on the running event loop
+        Safe to call more than once - the worker is only started the first time
+        """
+        if self._batch_worker_task is None:
+            self._batch_worker_task = asyncio.get_event_loop().create_task(
+                self._batch_worker()
+            )
+
+    async def process_file_async(self, file_bytes: bytes, filename: str) -> List[str]:
+        """
+        Queue a file for OCR and await its result
+
+        Requests arriving close together are grouped by the batch worker
+        into a single batched inference call
+
+        Args:
+            file_bytes: Raw bytes of the uploaded file
+            filename: Name of the file to determine type
+
+        Returns:
+            List of extracted text strings
+        """
+        # Lazily start the worker on the running loop (idempotent)
+        self.start_batch_worker()
+
+        future = asyncio.get_event_loop().create_future()
+        await self._queue.put((file_bytes, filename, future))
+        return await future
+
+    async def _batch_worker(self):
+        """
+        Background task that drains the request queue in micro-batches
+
+        Waits up to _BATCH_MAX_WAIT for additional requests after the first
+        one arrives, then runs the whole batch in a worker thread so the
+        event loop stays free
+        """
+        loop = asyncio.get_event_loop()
+
+        while True:
+            # Block until at least one request is waiting
+            batch = [await self._queue.get()]
+
+            # Collect more requests for a short window, up to the batch cap
+            while len(batch) < _BATCH_MAX_SIZE:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._queue.get(), timeout=_BATCH_MAX_WAIT
+                    ))
+                except asyncio.TimeoutError:
+                    break
+
+            # Run inference off the event loop on the dedicated OCR thread
+            try:
+                results = await loop.run_in_executor(
+                    _OCR_EXECUTOR,
+                    self._process_batch,
+                    [(file_bytes, filename) for file_bytes, filename, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            # Resolve futures - per-file failures come back as exceptions
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def _process_batch(self, items: List[tuple]) -> List[Any]:
+        """
+        OCR a batch of files with as few inference calls as possible
+
+        Args:
+            items: List of (file_bytes, filename) tuples
+
+        Returns:
+            List with one entry per item: the extracted text list on
+            success, or the exception that file raised
+        """
+        # Decode every file first so one batched inference call can cover
+        # all pages of all files in the batch. Each entry of page_counts
+        # is either a page count (needs OCR), a finished text list
+        # (embedded-text fast path) or an exception
+        page_counts: List[Any] = []
+        images: List[np.ndarray] = []
+
+        for file_bytes, filename in items:
+            try:
+                file_extension = filename.lower().split('.')[-1]
+
+                if file_extension == 'pdf':
+                    # Born-digital PDFs carry their text already - skip OCR
+                    embedded_text = self._pdf_embedded_text(file_bytes)
+                    if embedded_text is not None:
+                        page_counts.append(embedded_text)
+                        continue
+
+                    pages = self._pdf_to_images(file_bytes)
+                elif file_extension in _IMAGE_EXTENSIONS:
+                    pages = [self._image_to_array(file_bytes)]
+                else:
+                    raise ValueError(f"Unsupported file format: {file_extension}")
+
+                page_counts.append(len(pages))
+                images.extend(pages)
+            except Exception as e:
+                print(f"Error processing file: {e}")
+                page_counts.append(e)
+
+        # Batched inference needs uniform shapes; fall back to per-image
+        # calls for mixed-size batches
+        page_texts: List[List[str]] = []
+        if images:
+            if len({image.shape for image in images}) == 1:
+                page_texts = self.reader.readtext_batched(
+                    images, batch_size=_BATCH_MAX_SIZE, detail=0
+                )
+            else:
+                page_texts = [
+                    self.reader.readtext(image, detail=0) for image in images
+                ]
+
+        # Reassemble per-file results in request order
+        results: List[Any] = []
+        index = 0
+        for count in page_counts:
+            if isinstance(count, (Exception, list)):
+                results.append(count)
+            else:
+                results.append([
+                    text
+                    for page_text in page_texts[index:index + count]
+                    for text in page_text
+                ])
+                index += count
+
+        return results
     
     def process_file(self, file_bytes: bytes, filename: str) -> List[str]:
         """
@@ -43,53 +435,121 @@ class OCREngine:
         
         try:
             if file_extension == 'pdf':
-                # Handle PDF files
-                image_array = self._pdf_to_image(file_bytes)
-            elif file_extension in ['jpg', 'jpeg', 'png', 'bmp', 'tiff', 'webp']:
+                # Born-digital PDFs carry their text already - skip OCR
+                embedded_text = self._pdf_embedded_text(file_bytes)
+                if embedded_text is not None:
+                    return embedded_text
+
+                # Handle scanned PDF files - uniform-size pages go through
+                # one batched inference call so GPU kernel launches are
+                # amortized; mixed page sizes (A4/letter, rotated pages)
+                # would break EasyOCR's batch stacking, so they fall back
+                # to per-page calls
+                image_arrays = self._pdf_to_images(file_bytes)
+                if len({image.shape for image in image_arrays}) == 1:
+                    page_results = self.reader.readtext_batched(
+                        image_arrays, batch_size=_BATCH_MAX_SIZE, detail=0
+                    )
+                else:
+                    page_results = [
+                        self.reader.readtext(image, detail=0)
+                        for image in image_arrays
+                    ]
+                extracted_text = [
+                    text for page_text in page_results for text in page_text
+                ]
+            elif file_extension in _IMAGE_EXTENSIONS:
                 # Handle image files
                 image_array = self._image_to_array(file_bytes)
+                # detail=0 returns only text without bounding boxes
+                extracted_text = self.reader.readtext(image_array, detail=0)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
-            
-            # Extract text using EasyOCR
-            # detail=0 returns only text without bounding boxes
-            extracted_text = self.reader.readtext(image_array, detail=0)
-            
+
             return extracted_text
-            
+
         except Exception as e:
             print(f"Error processing file: {e}")
             raise
     
-    def _pdf_to_image(self, pdf_bytes: bytes) -> np.ndarray:
+    def _open_pdf(self, pdf_bytes: bytes):
         """
-        Convert first page of PDF to numpy array for OCR
-        
+        Open a PDF from bytes or a bytes-like object such as an mmap of
+        a spilled upload (older PyMuPDF only takes real bytes)
+        """
+        try:
+            return fitz.open(stream=pdf_bytes, filetype="pdf")
+        except (TypeError, ValueError):
+            return fitz.open(stream=bytes(pdf_bytes), filetype="pdf")
+
+    def _pdf_embedded_text(self, pdf_bytes: bytes) -> Optional[List[str]]:
+        """
+        Extract the text layer of a born-digital PDF, if it has one
+
+        Many "scanned" transcripts are really born-digital PDFs whose
+        text sits in the content stream; reading it costs ~10 ms versus
+        seconds of rasterization + OCR
+
         Args:
             pdf_bytes: Raw PDF file bytes
-            
+
         Returns:
-            Numpy array representation of the PDF page
+            List of non-empty text lines when the document carries a
+            usable text layer, or None when OCR is required
         """
-        # Open PDF from bytes
-        pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
-        
-        # Get the first page
-        first_page = pdf_document[0]
-        
-        # Render page to pixmap (image) at 300 DPI for better OCR
-        mat = fitz.Matrix(300/72, 300/72)  # 300 DPI scaling
-        pixmap = first_page.get_pixmap(matrix=mat)
-        
-        # Convert pixmap to PIL Image
-        img = Image.frombytes("RGB", [pixmap.width, pixmap.height], pixmap.samples)
-        
-        # Convert PIL Image to numpy array
-        image_array = np.array(img)
-        
+        pdf_document = self._open_pdf(pdf_bytes)
+        full_text = "\n".join(page.get_text("text") for page in pdf_document)
         pdf_document.close()
-        
-        return image_array
+
+        stripped = full_text.strip()
+        if len(stripped) >= _PDF_TEXT_MIN_CHARS and any(c.isalpha() for c in stripped):
+            return [line.strip() for line in stripped.splitlines() if line.strip()]
+
+        return None
+
+    def _pdf_to_images(self, pdf_bytes: bytes) -> List[np.ndarray]:
+        """
+        Convert every page of a PDF to numpy arrays for OCR
+
+        Args:
+            pdf_bytes: Raw PDF file bytes
+
+        Returns:
+            List of numpy array representations, one per page
+        """
+        pdf_document = self._open_pdf(pdf_bytes)
+
+        # Render pages to pixmaps at 200 DPI - OCR accuracy saturates
+        # around 200 DPI and (300/200)^2 means ~2.25x fewer pixels to process
+        mat = fitz.Matrix(200/72, 200/72)  # 200 DPI scaling
+
+        image_arrays = []
+        for page in pdf_document:
+            pixmap = page.get_pixmap(matrix=mat, alpha=False)
+
+            # View straight over the pixmap samples buffer - no copy.
+            # pixmap.samples is a bytes object, so the view keeps the
+            # data alive after the pixmap goes away, and EasyOCR's
+            # preprocessing only reads the input
+            image_array = np.frombuffer(pixmap.samples, dtype=np.uint8)
+
+            if pixmap.n == 1:
+                # Grayscale page
+                image_array = image_array.reshape(pixmap.height, pixmap.width)
+            else:
+                image_array = image_array.reshape(
+                    pixmap.height, pixmap.width, pixmap.n
+                )
+                if pixmap.n > 3:
+                    # Unexpected alpha channel - dropping it breaks
+                    # contiguity, so this path does copy
+                    image_array = np.ascontiguousarray(image_array[:, :, :3])
+
+            image_arrays.append(image_array)
+
+        pdf_document.close()
+
+        return image_arrays
     
     def _image_to_array(self, image_bytes: bytes) -> np.ndarray:
         """
@@ -101,16 +561,24 @@ class OCREngine:
         Returns:
             Numpy array representation of the image
         """
+        # JPEG fast path: decode with SIMD straight into an RGB numpy
+        # buffer (detected by magic bytes, not the filename extension)
+        if self._turbojpeg is not None and bytes(image_bytes[:3]) == b'\xff\xd8\xff':
+            try:
+                return self._turbojpeg.decode(image_bytes, pixel_format=TJPF_RGB)
+            except Exception as e:
+                print(f"TurboJPEG decode failed, falling back to PIL: {e}")
+
         # Open image from bytes
         image = Image.open(io.BytesIO(image_bytes))
-        
+
         # Convert to RGB if necessary (handles PNG with alpha, etc.)
         if image.mode != 'RGB':
             image = image.convert('RGB')
-        
+
         # Convert to numpy array
         image_array = np.array(image)
-        
+
         return image_array
     
     def extract_data(self, text_list: List[str]) -> Dict[str, Any]:
@@ -140,134 +608,122 @@ class OCREngine:
         
         # Track successful extractions for confidence calculation
         successful_extractions = 0
-        total_attempts = 3  # GPA, Name, Balance
         
+        # Lowercase once; reused by the anchor probes and the keyword factor
+        lowered = raw_text.lower()
+
+        # Cheap anchor probes decide which categories are worth scanning
+        gpa_possible = any(anchor in lowered for anchor in _GPA_ANCHORS)
+        name_possible = any(anchor in lowered for anchor in _NAME_ANCHORS)
+        financial_possible = any(anchor in lowered for anchor in _FINANCIAL_ANCHORS)
+
+        # A single Hyperscan pass refines the answer when available
+        # (and is skipped when the anchors already ruled everything out)
+        if gpa_possible or name_possible or financial_possible:
+            hs_categories = _hs_matching_categories(raw_text)
+            if hs_categories is not None:
+                gpa_possible = gpa_possible and _HS_GPA in hs_categories
+                name_possible = name_possible and _HS_NAME in hs_categories
+                financial_possible = financial_possible and _HS_FINANCIAL in hs_categories
+
         # ===== 1. EXTRACT GPA/PERCENTAGE =====
-        # Multiple comprehensive patterns to catch various formats
-        gpa_patterns = [
-            # CGPA variations
-            r'CGPA[:\s\-]*(\d+\.?\d*)',
-            r'\(CGPA\)[:\s\-]*(\d+\.?\d*)',
-            r'C\.?G\.?P\.?A\.?[:\s\-]*(\d+\.?\d*)',
-            
-            # GPA variations
-            r'GPA[:\s\-]*(\d+\.?\d*)',
-            r'G\.?P\.?A\.?[:\s\-]*(\d+\.?\d*)',
-            
-            # Grade variations
-            r'Grade[:\s\-]*(\d+\.?\d*)',
-            r'Final\s+Grade[:\s\-]*(\d+\.?\d*)',
-            
-            # Percentage variations
-            r'Percentage[:\s\-]*(\d+\.?\d*)',
-            r'(\d{1,3}\.?\d*)\s*%',
-            r'Percent[:\s\-]*(\d+\.?\d*)',
-            
-            # Score variations
-            r'Score[:\s\-]*(\d+\.?\d*)',
-            r'Total[:\s\-]*(\d+\.?\d*)'
-        ]
-        
-        for pattern in gpa_patterns:
-            match = re.search(pattern, raw_text, re.IGNORECASE)
-            if match:
-                gpa_value = match.group(1)
-                # Validate it's a reasonable GPA/percentage value
-                try:
-                    float_val = float(gpa_value)
-                    if 0 <= float_val <= 100:  # Valid range
-                        extracted_data["extracted_gpa"] = gpa_value
-                        successful_extractions += 1
-                        break
-                except ValueError:
-                    continue
+        gpa_matches = _GPA_RE.finditer(raw_text) if gpa_possible else ()
+        for match in gpa_matches:
+            gpa_value = _match_value(match)
+            # Validate it's a reasonable GPA/percentage value
+            try:
+                float_val = float(gpa_value)
+            except ValueError:
+                continue
+            if 0 <= float_val <= 100:  # Valid range
+                extracted_data["extracted_gpa"] = gpa_value
+                successful_extractions += 1
+                break
         
         # ===== 2. EXTRACT STUDENT NAME =====
-        # Multiple name extraction strategies
-        name_patterns = [
-            # Direct "Name:" pattern
-            r'(?:Student\s+)?Name[:\s]+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})',
-            # "Name of Student:" pattern
-            r'Name\s+of\s+(?:the\s+)?Student[:\s]+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})',
-            # Candidate name
-            r'Candidate[:\s]+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){1,3})'
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, raw_text_multiline, re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                
-                # Clean the name - remove common OCR artifacts and institutional words
-                stop_words = ['University', 'College', 'Institute', 'School', 'Department', 
-                             'Faculty', 'Of', 'The', 'And', 'CGPA', 'GPA', 'Grade']
-                
-                # Split name into words and filter
-                name_words = name.split()
-                cleaned_words = []
-                
-                for word in name_words:
-                    # Stop if we hit a stop word
-                    if word in stop_words:
-                        break
-                    # Only keep words that look like names (capitalized, letters only)
-                    if word[0].isupper() and word.isalpha():
-                        cleaned_words.append(word)
-                
-                # Only accept names with 2-4 words
-                if 2 <= len(cleaned_words) <= 4:
-                    extracted_data["extracted_name"] = " ".join(cleaned_words)
-                    successful_extractions += 1
+        name_matches = _NAME_RE.finditer(raw_text_multiline) if name_possible else ()
+        for match in name_matches:
+            name = _match_value(match).strip()
+
+            # Split name into words and filter out OCR artifacts
+            cleaned_words = []
+
+            for word in name.split():
+                # Stop if we hit a stop word
+                if word.lower() in _NAME_STOPWORDS:
                     break
+                # Only keep words that look like names (capitalized, letters only)
+                if word[0].isupper() and word.isalpha():
+                    cleaned_words.append(word)
+                    # Names are capped at 4 words - stop scanning early
+                    if len(cleaned_words) == 4:
+                        break
+
+            # Only accept names with 2-4 words
+            if 2 <= len(cleaned_words) <= 4:
+                extracted_data["extracted_name"] = " ".join(cleaned_words)
+                successful_extractions += 1
+                break
         
         # ===== 3. EXTRACT FINANCIAL INFORMATION =====
-        financial_patterns = [
-            # Balance patterns
-            r'Balance[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            r'Available\s+Balance[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            r'Current\s+Balance[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            
-            # Amount patterns
-            r'Amount[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            r'Total[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            
-            # Fee patterns
-            r'Fee[s]?[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)',
-            r'Tuition[:\s]*(?:Rs\.?|INR|₹|\$)\s*([0-9,]+\.?[0-9]*)'
-        ]
-        
-        for pattern in financial_patterns:
-            match = re.search(pattern, raw_text, re.IGNORECASE)
-            if match:
-                balance = match.group(1).replace(',', '')
-                # Validate it's a reasonable amount
-                try:
-                    float_val = float(balance)
-                    if float_val > 0:  # Valid amount
-                        extracted_data["extracted_balance"] = balance
-                        successful_extractions += 1
-                        break
-                except ValueError:
-                    continue
+        financial_matches = _FINANCIAL_RE.finditer(raw_text) if financial_possible else ()
+        for match in financial_matches:
+            balance = _match_value(match).replace(',', '')
+            # Validate it's a reasonable amount
+            try:
+                float_val = float(balance)
+            except ValueError:
+                continue
+            if float_val > 0:  # Valid amount
+                extracted_data["extracted_balance"] = balance
+                successful_extractions += 1
+                break
         
         # ===== CALCULATE CONFIDENCE SCORE =====
         # Base confidence on multiple factors
         
         # Factor 1: Extraction success rate (60% weight)
-        extraction_confidence = (successful_extractions / total_attempts) * 0.6
+        extraction_confidence = (successful_extractions / _EXTRACTION_ATTEMPTS) * 0.6
         
         # Factor 2: Text length/quality (20% weight)
         # More text generally means better OCR quality
         text_length_confidence = min(len(raw_text) / 500, 1.0) * 0.2
         
         # Factor 3: Text contains expected keywords (20% weight)
-        keywords = ['Name', 'GPA', 'CGPA', 'Grade', 'Student', 'University']
-        keyword_count = sum(1 for keyword in keywords if keyword.lower() in raw_text.lower())
-        keyword_confidence = min(keyword_count / len(keywords), 1.0) * 0.2
+        keyword_hits = set(_KEYWORD_RE.findall(lowered))
+        # 'cgpa' contains 'gpa', which the per-keyword substring test
+        # counted as a separate hit
+        if 'cgpa' in keyword_hits:
+            keyword_hits.add('gpa')
+        keyword_confidence = min(len(keyword_hits) / _KEYWORD_TOTAL, 1.0) * 0.2
         
-        # Total confidence
+        # Total confidence, rounded to 2 decimals without the round()
+        # dispatch (the score is always a small non-negative float)
         total_confidence = extraction_confidence + text_length_confidence + keyword_confidence
-        
-        extracted_data["confidence_score"] = round(total_confidence, 2)
-        
-        return extracted_data
\ No newline at end of file
+
+        extracted_data["confidence_score"] = int(total_confidence * 100 + 0.5) / 100
+
+        return extracted_data
+
+# Process-wide singleton, created lazily: model load takes seconds and
+# holds VRAM, so it is deferred to the first request instead of import
+# time, and importing this module twice never loads a second copy
+_ocr_engine = None
+_ocr_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OCREngine:
+    """
+    Return the shared OCREngine, creating it on first use
+
+    Double-checked locking keeps concurrent first requests from racing
+    to load duplicate models
+    """
+    global _ocr_engine
+
+    if _ocr_engine is None:
+        with _ocr_engine_lock:
+            if _ocr_engine is None:
+                _ocr_engine = OCREngine()
+
+    return _ocr_engine